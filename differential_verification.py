@@ -0,0 +1,465 @@
+import argparse
+import multiprocessing
+import random
+import time
+
+from roman_calculator import roman_numeral_calculator, convert_to_roman, \
+	INCORRECT_INPUT, OUT_OF_INTERVAL, OPERATOR_SYMBOLS, \
+	ROMAN_NUMERAL_CHARACTERS, MIN_VALUE, MAX_VALUE
+from roman_table import table_convert_to_arabic, \
+	table_roman_numeral_calculator
+from roman_to_arabic import convert_to_arabic, CONVERSION_FAILED
+
+INVALID_CHARACTERS = ROMAN_NUMERAL_CHARACTERS + 'ivxlcdmAZ09 \n'
+EXPRESSION_CHARACTERS = ROMAN_NUMERAL_CHARACTERS + OPERATOR_SYMBOLS + ' @\n'
+
+DEFAULT_INVALID_SAMPLES = 200000
+DEFAULT_MAX_INVALID_LENGTH = 16
+DEFAULT_SEED = 1
+MAX_MISMATCHES_PER_CLASS = 5
+
+
+def canonical_numerals(max_value: int = MAX_VALUE) -> list:
+	"""
+	Creates list of all canonical roman numerals from MIN_VALUE to max_value.
+	:param max_value: int - the highest value to convert
+	:return: list - roman numeral strings, index 0 contains empty string
+	"""
+	return [''] + [
+		convert_to_roman(number) for number in range(MIN_VALUE, max_value + 1)
+	]
+
+
+_ROMAN_NUMERALS = canonical_numerals()
+_CANONICAL_NUMERALS = set(_ROMAN_NUMERALS[MIN_VALUE:])
+
+
+REFERENCE_CONVERTER = convert_to_arabic
+REFERENCE_CALCULATOR = roman_numeral_calculator
+
+CONVERTER_ENGINES = {
+	'table': table_convert_to_arabic,
+}
+CALCULATOR_ENGINES = {
+	'table': table_roman_numeral_calculator,
+}
+BATCH_CONVERTER_ENGINES = dict()
+BATCH_CALCULATOR_ENGINES = dict()
+
+
+class EngineReport:
+	"""
+	Collects number of compared inputs, mismatches and time spent in the
+	reference and in the compared engine.
+	"""
+	def __init__(self, engine_name: str, kind: str):
+		self._engine_name = engine_name
+		self._kind = kind
+		self._compared = 0
+		self._mismatch_count = 0
+		self._mismatches = dict()
+		self._reference_time = 0.0
+		self._engine_time = 0.0
+
+	def get_engine_name(self) -> str:
+		return self._engine_name
+
+	def get_kind(self) -> str:
+		return self._kind
+
+	def get_compared(self) -> int:
+		return self._compared
+
+	def get_mismatch_count(self) -> int:
+		return self._mismatch_count
+
+	def get_mismatches(self) -> dict:
+		return self._mismatches
+
+	def get_speedup(self) -> float:
+		if self._engine_time == 0:
+			return float('inf')
+		return self._reference_time / self._engine_time
+
+	def add(self, chunk_result: tuple):
+		"""
+		Adds results of one compared chunk to the report.
+		:param chunk_result: tuple - compared count, mismatch count, samples of
+		mismatches by failure class, reference time, engine time
+		"""
+		compared, mismatch_count, mismatches, reference_time, engine_time = \
+			chunk_result
+
+		self._compared += compared
+		self._mismatch_count += mismatch_count
+		for failure_class, samples in mismatches.items():
+			class_samples = self._mismatches.setdefault(failure_class, [])
+			free_slots = MAX_MISMATCHES_PER_CLASS - len(class_samples)
+			class_samples.extend(samples[:free_slots])
+		self._reference_time += reference_time
+		self._engine_time += engine_time
+
+	def format(self) -> str:
+		"""
+		Creates human readable summary of the report.
+		:return: str - report summary
+		"""
+		lines = [
+			f'{self._kind} engine {self._engine_name!r}: '
+			f'{self._compared} inputs, {self._mismatch_count} mismatches, '
+			f'reference {self._reference_time:.2f}s, '
+			f'engine {self._engine_time:.2f}s, '
+			f'speedup {self.get_speedup():.2f}x'
+		]
+		for (expected_class, actual_class), samples in \
+			sorted(self._mismatches.items()):
+			lines.append(f'  expected {expected_class}, got {actual_class}:')
+			for argument, expected, actual in samples:
+				lines.append(
+					f'    {argument!r}: expected {expected!r}, got {actual!r}'
+				)
+		return '\n'.join(lines)
+
+
+def invalid_numerals(
+		count: int, seed: int = DEFAULT_SEED,
+		max_length: int = DEFAULT_MAX_INVALID_LENGTH
+	) -> list:
+	"""
+	Generates seeded sample of strings, which are not canonical numerals.
+	:param count: int - number of strings to generate
+	:param seed: int - seed of the random generator
+	:param max_length: int - maximal length of generated string
+	:return: list - generated strings
+	"""
+	generator = random.Random(seed)
+	numerals = ['']
+
+	while len(numerals) < count:
+		length = generator.randint(1, max_length)
+		numeral = ''.join(generator.choices(INVALID_CHARACTERS, k=length))
+		if numeral not in _CANONICAL_NUMERALS:
+			numerals.append(numeral)
+
+	return numerals[:count]
+
+
+def invalid_expressions(
+		count: int, seed: int = DEFAULT_SEED, max_value: int = MAX_VALUE,
+		max_length: int = DEFAULT_MAX_INVALID_LENGTH
+	) -> list:
+	"""
+	Generates seeded sample of expressions rejected by reference calculator.
+	Half of them are random strings, the other half contain operator between
+	invalid numeral and canonical numeral not higher than max_value in random
+	order, or between two invalid numerals.
+	:param count: int - number of expressions to generate
+	:param seed: int - seed of the random generator
+	:param max_value: int - the highest value of the canonical operand
+	:param max_length: int - maximal length of generated expression
+	:return: list - generated expressions
+	"""
+	generator = random.Random(f'{seed}-expressions')
+	numerals = invalid_numerals(count, seed, max_length)
+	expressions = []
+
+	while len(expressions) < count:
+		if generator.random() < 0.5:
+			length = generator.randint(0, max_length)
+			expression = ''.join(
+				generator.choices(EXPRESSION_CHARACTERS, k=length)
+			)
+		else:
+			operands = [
+				generator.choice(numerals),
+				_ROMAN_NUMERALS[generator.randint(MIN_VALUE, max_value)]
+			]
+			side = generator.randrange(3)
+			if side == 1:
+				operands.reverse()
+			elif side == 2:
+				operands[1] = generator.choice(numerals)
+			operator = generator.choice(OPERATOR_SYMBOLS)
+			expression = f'{operands[0]} {operator} {operands[1]}'
+
+		if REFERENCE_CALCULATOR(expression) == INCORRECT_INPUT:
+			expressions.append(expression)
+
+	return expressions
+
+
+def _failure_class(result) -> str:
+	"""
+	Names the kind of result returned by converter or calculator.
+	:param result: returned value or raised exception
+	:return: str - error constant or type of the result
+	"""
+	if isinstance(result, Exception):
+		return f'raised {type(result).__name__}'
+	elif type(result) is int and result == CONVERSION_FAILED:
+		return 'CONVERSION_FAILED'
+	elif result in (INCORRECT_INPUT, OUT_OF_INTERVAL):
+		return repr(result)
+
+	return type(result).__name__
+
+
+def _registered_engines(kind: str) -> list:
+	"""
+	Lists engines registered for kind of comparison.
+	:param kind: str - 'converter' or 'calculator'
+	:return: list - tuples of engine name, engine callable and whether the
+	engine takes whole list of arguments at once
+	"""
+	if kind == 'converter':
+		engines, batch_engines = CONVERTER_ENGINES, BATCH_CONVERTER_ENGINES
+	else:
+		engines, batch_engines = CALCULATOR_ENGINES, BATCH_CALCULATOR_ENGINES
+
+	return [
+		(engine_name, engine, False) for engine_name, engine in engines.items()
+	] + [
+		(engine_name, engine, True)
+		for engine_name, engine in batch_engines.items()
+	]
+
+
+def _call_engine(engine, argument):
+	"""
+	Calls engine on one argument.
+	:param engine: callable - tested engine
+	:param argument: argument passed to the engine
+	:return: result of the engine or exception raised by it
+	"""
+	try:
+		return engine(argument)
+	except Exception as error:
+		return error
+
+
+def _call_batch_engine(engine, arguments: list) -> list:
+	"""
+	Calls batch engine on all arguments at once.
+	:param engine: callable - tested engine taking and returning list
+	:param arguments: list - arguments passed to the engine
+	:return: list - results of the engine, or exception raised by it for
+	every argument
+	"""
+	try:
+		results = list(engine(arguments))
+	except Exception as error:
+		return [error] * len(arguments)
+
+	if len(results) != len(arguments):
+		error = ValueError(
+			f'batch engine returned {len(results)} results '
+			f'for {len(arguments)} arguments'
+		)
+		return [error] * len(arguments)
+
+	return results
+
+
+def _compare_results(
+		arguments: list, expected_results: list, actual_results: list
+	) -> tuple:
+	"""
+	Finds arguments on which engine returned different result than reference.
+	:param arguments: list - compared arguments
+	:param expected_results: list - results of the reference
+	:param actual_results: list - results of the engine
+	:return: tuple - mismatch count, samples of mismatches by failure class
+	"""
+	mismatch_count = 0
+	mismatches = dict()
+	for argument, expected, actual in \
+		zip(arguments, expected_results, actual_results):
+		if type(expected) is type(actual) and expected == actual:
+			continue
+
+		mismatch_count += 1
+		failure_class = (_failure_class(expected), _failure_class(actual))
+		samples = mismatches.setdefault(failure_class, [])
+		if len(samples) < MAX_MISMATCHES_PER_CLASS:
+			if isinstance(actual, Exception):
+				actual = repr(actual)
+			samples.append((argument, expected, actual))
+
+	return mismatch_count, mismatches
+
+
+def _compare_chunk(kind: str, arguments: list) -> list:
+	"""
+	Computes reference results on list of arguments once and compares every
+	engine registered for kind with them.
+	:param kind: str - 'converter' or 'calculator'
+	:param arguments: list - arguments passed to all implementations
+	:return: list - tuples of engine name and chunk result containing
+	compared count, mismatch count, samples of mismatches by failure class,
+	reference time, engine time
+	"""
+	if kind == 'converter':
+		reference = REFERENCE_CONVERTER
+	else:
+		reference = REFERENCE_CALCULATOR
+
+	start = time.perf_counter()
+	expected_results = [reference(argument) for argument in arguments]
+	reference_time = time.perf_counter() - start
+
+	engine_results = []
+	for engine_name, engine, is_batch in _registered_engines(kind):
+		start = time.perf_counter()
+		if is_batch:
+			actual_results = _call_batch_engine(engine, arguments)
+		else:
+			actual_results = [
+				_call_engine(engine, argument) for argument in arguments
+			]
+		engine_time = time.perf_counter() - start
+
+		mismatch_count, mismatches = _compare_results(
+			arguments, expected_results, actual_results
+		)
+		engine_results.append((engine_name, (
+			len(arguments), mismatch_count, mismatches, reference_time,
+			engine_time
+		)))
+
+	return engine_results
+
+
+def _operand_row(operator: str, num1: int, max_value: int) -> list:
+	"""
+	Creates all expressions with the first operand num1 and operator.
+	:param operator: str - operator used in expressions
+	:param num1: int - value of the first operand
+	:param max_value: int - the highest value of the second operand
+	:return: list - expressions
+	"""
+	roman_num1 = _ROMAN_NUMERALS[num1]
+	return [
+		f'{roman_num1}{operator}{_ROMAN_NUMERALS[num2]}'
+		for num2 in range(MIN_VALUE, max_value + 1)
+	]
+
+
+def _run_task(task: tuple) -> tuple:
+	"""
+	Runs one task in a worker process.
+	:param task: tuple - (kind, task arguments)
+	:return: tuple - kind and results of _compare_chunk
+	"""
+	kind, arguments = task
+	if kind == 'operands':
+		return 'calculator', _compare_chunk(
+			'calculator', _operand_row(*arguments)
+		)
+	return kind, _compare_chunk(kind, arguments)
+
+
+def _chunks(items: list, chunk_size: int):
+	for index in range(0, len(items), chunk_size):
+		yield items[index:index + chunk_size]
+
+
+def _create_tasks(
+		max_value: int, invalid_count: int, seed: int, chunk_size: int
+	) -> list:
+	"""
+	Creates list of tasks covering whole verified domain. Every task is
+	compared with all registered engines of its kind.
+	:param max_value: int - the highest verified numeral value
+	:param invalid_count: int - number of generated invalid inputs
+	:param seed: int - seed of the random generator
+	:param chunk_size: int - number of sampled inputs in one task, operand
+	combinations are always split by first operand and operator
+	:return: list - tasks for _run_task
+	"""
+	numerals = _ROMAN_NUMERALS[MIN_VALUE:max_value + 1]
+	converter_inputs = numerals + invalid_numerals(invalid_count, seed)
+	calculator_inputs = invalid_expressions(invalid_count, seed, max_value)
+
+	tasks = []
+	for chunk in _chunks(converter_inputs, chunk_size):
+		tasks.append(('converter', chunk))
+	for chunk in _chunks(calculator_inputs, chunk_size):
+		tasks.append(('calculator', chunk))
+	for operator in OPERATOR_SYMBOLS:
+		for num1 in range(MIN_VALUE, max_value + 1):
+			tasks.append(('operands', (operator, num1, max_value)))
+
+	return tasks
+
+
+def verify(
+		max_value: int = MAX_VALUE,
+		invalid_count: int = DEFAULT_INVALID_SAMPLES,
+		seed: int = DEFAULT_SEED, processes: int = None,
+		chunk_size: int = MAX_VALUE
+	) -> list:
+	"""
+	Compares all registered engines with reference implementation on every
+	canonical numeral, sample of invalid strings and every combination of
+	operands and operators up to max_value.
+	:param max_value: int - the highest verified numeral value
+	:param invalid_count: int - number of generated invalid inputs
+	:param seed: int - seed of the random generator
+	:param processes: int - number of worker processes, all cpus if None
+	:param chunk_size: int - number of sampled inputs in one task
+	:return: list - EngineReport for every engine
+	"""
+	reports = {}
+	for kind in ('converter', 'calculator'):
+		for engine_name, _, _ in _registered_engines(kind):
+			reports[kind, engine_name] = EngineReport(engine_name, kind)
+
+	tasks = _create_tasks(max_value, invalid_count, seed, chunk_size)
+
+	with multiprocessing.Pool(processes) as pool:
+		for kind, engine_results in pool.imap_unordered(_run_task, tasks):
+			for engine_name, chunk_result in engine_results:
+				reports[kind, engine_name].add(chunk_result)
+
+	return list(reports.values())
+
+
+def main():
+	parser = argparse.ArgumentParser(
+		description='Compares alternative converter and calculator engines '
+		'with the reference implementation.'
+	)
+	parser.add_argument('--max-value', type=int, default=MAX_VALUE)
+	parser.add_argument(
+		'--invalid-samples', type=int, default=DEFAULT_INVALID_SAMPLES
+	)
+	parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+	parser.add_argument('--processes', type=int, default=None)
+	parser.add_argument('--chunk-size', type=int, default=MAX_VALUE)
+	arguments = parser.parse_args()
+
+	if arguments.max_value < MIN_VALUE:
+		parser.error(f'--max-value must be at least {MIN_VALUE}')
+	if arguments.invalid_samples < 0:
+		parser.error('--invalid-samples must not be negative')
+	if arguments.processes is not None and arguments.processes < 1:
+		parser.error('--processes must be at least 1')
+	if arguments.chunk_size < 1:
+		parser.error('--chunk-size must be at least 1')
+
+	start = time.perf_counter()
+	reports = verify(
+		min(arguments.max_value, MAX_VALUE), arguments.invalid_samples,
+		arguments.seed, arguments.processes, arguments.chunk_size
+	)
+
+	for report in reports:
+		print(report.format())
+	print(f'Finished in {time.perf_counter() - start:.2f}s')
+
+	if any(report.get_mismatch_count() for report in reports):
+		raise SystemExit(1)
+
+
+if __name__ == '__main__':
+	main()
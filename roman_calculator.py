@@ -209,3 +209,15 @@ def roman_numeral_calculator(expression: str) -> str:
 	
 	result = calculator.evaluate(expression)
 	return result
+
+
+def convert_to_roman(number: int) -> str:
+	"""
+	Converts integer from interval MIN_VALUE to MAX_VALUE to roman numeral.
+	:param number: int - number to convert
+	:raise: ResultOutOfIntervalError - if number is out of interval
+	:return: str - roman numeral string
+	"""
+	calculator = RomanNumeralCalculator()
+
+	return calculator._to_roman(number)
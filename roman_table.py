@@ -0,0 +1,60 @@
+import re
+from roman_calculator import convert_to_roman, INCORRECT_INPUT, \
+	OUT_OF_INTERVAL, OPERATOR_SYMBOLS, ROMAN_NUMERAL_CHARACTERS, MIN_VALUE, \
+	MAX_VALUE
+from roman_to_arabic import CONVERSION_FAILED
+
+_ROMAN_NUMERALS = [''] + [
+	convert_to_roman(number) for number in range(MIN_VALUE, MAX_VALUE + 1)
+]
+_ARABIC_NUMBERS = {
+	numeral: number
+	for number, numeral in enumerate(_ROMAN_NUMERALS)
+	if number >= MIN_VALUE
+}
+_EXPRESSION_PATTERN = re.compile(
+	f'([{ROMAN_NUMERAL_CHARACTERS}]+)([{re.escape(OPERATOR_SYMBOLS)}])'
+	f'([{ROMAN_NUMERAL_CHARACTERS}]+)'
+)
+
+
+def table_convert_to_arabic(roman_numeral: str) -> int:
+	"""
+	Converts roman numeral to arabic using precomputed table of all canonical
+	numerals.
+	:param roman_numeral: str - string containing the roman number
+	:return: int - converted roman number or -9999 if conversion failed
+	"""
+	return _ARABIC_NUMBERS.get(roman_numeral, CONVERSION_FAILED)
+
+
+def table_roman_numeral_calculator(expression: str) -> str:
+	"""
+	Evaluates roman numeral expression using precomputed tables instead of
+	prefix tree and repeated conversion to roman numeral.
+	:param expression: str - expression to evaluate
+	:return: str - roman numeral result of expression or one of errors
+	"""
+	matched = _EXPRESSION_PATTERN.fullmatch(expression.replace(' ', ''))
+	if not matched:
+		return INCORRECT_INPUT
+
+	roman_num1, op, roman_num2 = matched.groups()
+	num1 = _ARABIC_NUMBERS.get(roman_num1)
+	num2 = _ARABIC_NUMBERS.get(roman_num2)
+	if num1 is None or num2 is None:
+		return INCORRECT_INPUT
+
+	if op == '+':
+		result = num1 + num2
+	elif op == '-':
+		result = num1 - num2
+	elif op == '*':
+		result = num1 * num2
+	else:
+		result = num1 // num2
+
+	if not MIN_VALUE <= result <= MAX_VALUE:
+		return OUT_OF_INTERVAL
+
+	return _ROMAN_NUMERALS[result]
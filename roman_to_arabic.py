@@ -22,7 +22,7 @@ class RomanNumeralNode:
 		self._children = dict()
 
 	def __le__(self, other):
-		return self._numeral_string <= other.get_numeral_string()
+		return self._numeral_value <= other.get_numeral_value()
 
 	def get_numeral_string(self) -> str:
 		return self._numeral_string
@@ -96,6 +96,15 @@ class TestRomanToArabicMethods(unittest.TestCase):
 	def test_XXi_(self):
 		self.assertEqual(convert_to_arabic('XXi'), CONVERSION_FAILED)
 		
+	def test_LX(self):
+		self.assertEqual(convert_to_arabic('LX'), 60)
+		
+	def test_MMLXXXIX(self):
+		self.assertEqual(convert_to_arabic('MMLXXXIX'), 2089)
+		
+	def test_XXL(self):
+		self.assertEqual(convert_to_arabic('XXL'), CONVERSION_FAILED)
+		
 
 if __name__ == '__main__':
 	unittest.main()
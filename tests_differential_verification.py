@@ -0,0 +1,153 @@
+import unittest
+import differential_verification
+from differential_verification import canonical_numerals, invalid_numerals, \
+	invalid_expressions, verify, EngineReport, MAX_MISMATCHES_PER_CLASS
+from roman_calculator import roman_numeral_calculator, INCORRECT_INPUT
+from roman_to_arabic import convert_to_arabic, CONVERSION_FAILED
+
+
+class TestDifferentialVerification(unittest.TestCase):
+	def test_canonical_numerals(self):
+		self.assertEqual(canonical_numerals(4), ['', 'I', 'II', 'III', 'IV'])
+
+	def test_canonical_numerals_count(self):
+		self.assertEqual(len(canonical_numerals()), 4000)
+
+	def test_invalid_numerals_seeded(self):
+		self.assertEqual(invalid_numerals(100, 7), invalid_numerals(100, 7))
+
+	def test_invalid_numerals_not_canonical(self):
+		canonical = set(canonical_numerals()[1:])
+		numerals = invalid_numerals(1000)
+		self.assertEqual(len(numerals), 1000)
+		self.assertFalse(canonical.intersection(numerals))
+
+	def test_invalid_expressions_seeded(self):
+		self.assertEqual(
+			invalid_expressions(100, 7), invalid_expressions(100, 7)
+		)
+
+	def test_invalid_expressions_are_invalid(self):
+		expressions = invalid_expressions(2000, max_value=100)
+		self.assertEqual(len(expressions), 2000)
+		for expression in expressions:
+			self.assertEqual(
+				roman_numeral_calculator(expression), INCORRECT_INPUT
+			)
+
+	def test_invalid_expressions_canonical_operand_on_both_sides(self):
+		canonical = set(canonical_numerals(100)[1:])
+		left = right = 0
+		for expression in invalid_expressions(2000, max_value=100):
+			operands = expression.split(' ')
+			if len(operands) != 3:
+				continue
+			left += operands[0] in canonical
+			right += operands[2] in canonical
+		self.assertGreater(left, 100)
+		self.assertGreater(right, 100)
+
+	def test_report_limits_mismatches_per_class(self):
+		report = EngineReport('table', 'converter')
+		failed = [('X', 10, CONVERSION_FAILED)] * (MAX_MISMATCHES_PER_CLASS + 5)
+		report.add((
+			100, len(failed), {('int', 'CONVERSION_FAILED'): failed}, 2.0, 1.0
+		))
+		report.add((
+			100, 1, {('int', 'int'): [('V', 5, 6)]}, 2.0, 1.0
+		))
+		self.assertEqual(report.get_compared(), 200)
+		self.assertEqual(
+			report.get_mismatch_count(), MAX_MISMATCHES_PER_CLASS + 6
+		)
+		self.assertEqual(
+			len(report.get_mismatches()[('int', 'CONVERSION_FAILED')]),
+			MAX_MISMATCHES_PER_CLASS
+		)
+		self.assertEqual(
+			report.get_mismatches()[('int', 'int')], [('V', 5, 6)]
+		)
+		self.assertEqual(report.get_speedup(), 2.0)
+
+	def test_lx_divergence_reported(self):
+		def rejecting_lx(roman_numeral):
+			if 'LX' in roman_numeral:
+				return CONVERSION_FAILED
+			return convert_to_arabic(roman_numeral)
+
+		engines = differential_verification.CONVERTER_ENGINES
+		engines['rejecting_lx'] = rejecting_lx
+		try:
+			engine_results = dict(differential_verification._compare_chunk(
+				'converter', canonical_numerals(100)[1:]
+			))
+		finally:
+			del engines['rejecting_lx']
+
+		compared, mismatch_count, mismatches, _, _ = \
+			engine_results['rejecting_lx']
+
+		self.assertEqual(compared, 100)
+		self.assertEqual(mismatch_count, 30)
+		self.assertEqual(
+			mismatches[('int', 'CONVERSION_FAILED')][0],
+			('LX', 60, CONVERSION_FAILED)
+		)
+
+	def test_raised_exception_reported(self):
+		def raising_on_newline(expression):
+			if '\n' in expression:
+				raise ValueError('newline')
+			return roman_numeral_calculator(expression)
+
+		engines = differential_verification.CALCULATOR_ENGINES
+		engines['raising'] = raising_on_newline
+		try:
+			engine_results = dict(differential_verification._compare_chunk(
+				'calculator', ['V\n', 'V+V', 'I+I\n']
+			))
+		finally:
+			del engines['raising']
+
+		compared, mismatch_count, mismatches, _, _ = engine_results['raising']
+		self.assertEqual(compared, 3)
+		self.assertEqual(mismatch_count, 2)
+		self.assertEqual(
+			mismatches[(repr(INCORRECT_INPUT), 'raised ValueError')][0],
+			('V\n', INCORRECT_INPUT, "ValueError('newline')")
+		)
+		self.assertEqual(engine_results['table'][1], 0)
+
+	def test_batch_engine_reported(self):
+		def batch_rejecting_lx(numerals):
+			return [
+				CONVERSION_FAILED if 'LX' in numeral
+				else convert_to_arabic(numeral)
+				for numeral in numerals
+			]
+
+		engines = differential_verification.BATCH_CONVERTER_ENGINES
+		engines['batch'] = batch_rejecting_lx
+		try:
+			engine_results = dict(differential_verification._compare_chunk(
+				'converter', canonical_numerals(100)[1:]
+			))
+		finally:
+			del engines['batch']
+
+		self.assertEqual(engine_results['batch'][1], 30)
+		self.assertEqual(engine_results['table'][1], 0)
+
+	def test_verify_small_domain(self):
+		reports = verify(max_value=100, invalid_count=500, processes=2)
+		compared = {
+			report.get_kind(): report.get_compared() for report in reports
+		}
+		self.assertEqual(compared['converter'], 600)
+		self.assertEqual(compared['calculator'], 500 + 4 * 100 * 100)
+		for report in reports:
+			self.assertEqual(report.get_mismatch_count(), 0)
+
+
+if __name__ == '__main__':
+	unittest.main()
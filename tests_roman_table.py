@@ -0,0 +1,44 @@
+import unittest
+from roman_table import table_convert_to_arabic, \
+	table_roman_numeral_calculator
+from roman_calculator import INCORRECT_INPUT, OUT_OF_INTERVAL
+from roman_to_arabic import CONVERSION_FAILED
+
+
+class TestRomanTable(unittest.TestCase):
+	def test_convert_MCMXCIX(self):
+		self.assertEqual(table_convert_to_arabic('MCMXCIX'), 1999)
+
+	def test_convert_LX(self):
+		self.assertEqual(table_convert_to_arabic('LX'), 60)
+
+	def test_convert_IIII(self):
+		self.assertEqual(table_convert_to_arabic('IIII'), CONVERSION_FAILED)
+
+	def test_convert_empty(self):
+		self.assertEqual(table_convert_to_arabic(''), CONVERSION_FAILED)
+
+	def test_calculator_spaces(self):
+		self.assertEqual(table_roman_numeral_calculator(' XI + I X '), 'XX')
+
+	def test_calculator_division(self):
+		self.assertEqual(table_roman_numeral_calculator('XXV/V'), 'V')
+
+	def test_calculator_out_of_range(self):
+		self.assertEqual(
+			table_roman_numeral_calculator('MMM + M'), OUT_OF_INTERVAL
+		)
+
+	def test_calculator_newline(self):
+		self.assertEqual(
+			table_roman_numeral_calculator('I+I\n'), INCORRECT_INPUT
+		)
+
+	def test_calculator_multiple_operators(self):
+		self.assertEqual(
+			table_roman_numeral_calculator('I+I+I'), INCORRECT_INPUT
+		)
+
+
+if __name__ == '__main__':
+	unittest.main()